@@ -0,0 +1,51 @@
+"""Command history for gimbal telemetry"""
+
+import numpy as np
+
+# Action codes stored in the history
+ACTION_CODES = {'pan': 0, 'tilt': 1, 'home': 2, 'stop': 3, 'error': 4}
+ACTION_OTHER = 5
+
+class CommandHistory:
+    """Fixed-size ring buffer of processed commands
+    
+    Each field is kept in its own numpy array (structure of arrays), so
+    statistics over the history are vectorized reductions rather than a
+    scan over command objects. Once full, the oldest entries are overwritten.
+    """
+    
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self.actions = np.empty(capacity, np.uint8)
+        self.values = np.empty(capacity, np.float32)
+        self.succeeded = np.empty(capacity, np.bool_)
+        
+        # Next slot to write and number of valid entries
+        self._index = 0
+        self._count = 0
+        
+    def __len__(self) -> int:
+        return self._count
+        
+    def append(self, command):
+        """Record a processed command"""
+        i = self._index
+        self.actions[i] = ACTION_CODES.get(command.action, ACTION_OTHER)
+        self.values[i] = command.value
+        self.succeeded[i] = command.success
+        
+        self._index = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+            
+    def mean_value(self, action: str) -> float:
+        """Mean angle of recorded commands with the given action (0 if none)"""
+        code = ACTION_CODES.get(action, ACTION_OTHER)
+        values = self.values[:self._count][self.actions[:self._count] == code]
+        return float(values.mean()) if values.size else 0.0
+        
+    def success_rate(self) -> float:
+        """Fraction of recorded commands that were understood (0 if empty)"""
+        if not self._count:
+            return 0.0
+        return float(np.count_nonzero(self.succeeded[:self._count])) / self._count
@@ -11,8 +11,15 @@ class Config:
     # LLM Configuration
     llm_provider: str = "ollama"
     ollama_url: str = "http://localhost:11434"
-    ollama_model: str = "llama3.2:1b"
+    ollama_model: str = "qwen2.5:0.5b-instruct-q4_K_M"  # small Q4 quantized model
     ollama_enabled: bool = True
+    ollama_batch_interval: float = 0.02  # seconds to collect requests into a batch
+    ollama_max_concurrency: int = 1  # inferences running at once
+    ollama_max_pending: int = 4  # requests waiting beyond that; the oldest is dropped
+    
+    # Parsed-command cache
+    llm_cache_size: int = 256
+    llm_cache_ttl: float = 60.0  # seconds
     
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-3.5-turbo"
@@ -33,8 +40,15 @@ class Config:
     
     def __post_init__(self):
         """Load configuration from environment variables"""
-        self.openai_api_key = os.getenv('OPENAI_API_KEY')
-        self.ollama_url = os.getenv('OLLAMA_URL', self.ollama_url)
+        env = os.environ
+        self.openai_api_key = env.get('OPENAI_API_KEY')
+        self.ollama_url = env.get('OLLAMA_URL', self.ollama_url)
+        self.ollama_model = env.get('OLLAMA_MODEL', self.ollama_model)
         
-        if os.getenv('LLM_PROVIDER'):
-            self.llm_provider = os.getenv('LLM_PROVIDER')
\ No newline at end of file
+        provider = env.get('LLM_PROVIDER')
+        if provider:
+            self.llm_provider = provider
+            
+        vsync = env.get('GRAPHICS_VSYNC')
+        if vsync:
+            self.graphics_vsync = vsync.lower() not in ('0', 'false', 'no', 'off')
\ No newline at end of file
@@ -3,12 +3,33 @@
 import math
 import logging
 from typing import Dict, Any
-from PyQt6.QtCore import QObject, pyqtSignal
+import numpy as np
+from PyQt6.QtCore import (
+    QObject, QPropertyAnimation, QAbstractAnimation, QEasingCurve, QTimer, pyqtSignal, pyqtProperty
+)
+
+# Angular velocity per unit of speed (degrees/s); speed 5 covers 90° in one second
+DEG_PER_SEC_PER_SPEED = 18.0
+
+# Remaining distance (degrees) that is snapped to rather than animated
+SNAP_DISTANCE = 0.1
+
+# Smallest movement (degrees) worth announcing through position_changed
+POSITION_EPSILON = 1e-3
+
+# Axis indices into the position/target vectors
+PAN = 0
+TILT = 1
 
 class GimbalController(QObject):
     """Controls gimbal position and movement"""
     
-    position_changed = pyqtSignal(dict)
+    __slots__ = (
+        'config', 'logger', 'speed', 'is_moving',
+        '_pos', '_target', '_emitted', '_pan_anim', '_tilt_anim', 'status'
+    )
+    
+    position_changed = pyqtSignal(float, float, int)  # pan, tilt, speed
     status_changed = pyqtSignal(str)
     
     def __init__(self, config):
@@ -16,19 +37,60 @@ class GimbalController(QObject):
         self.config = config
         self.logger = logging.getLogger(__name__)
         
-        # Current position
-        self.pan = 0.0
-        self.tilt = 0.0
+        # Current position, one entry per axis (pan, tilt)
+        self._pos = np.zeros(2)
         self.speed = 5
         
         # Movement state
         self.is_moving = False
-        self.target_pan = 0.0
-        self.target_tilt = 0.0
+        self._target = np.zeros(2)
+        
+        # Last position announced through position_changed
+        self._emitted = np.zeros(2)
+        
+        # Axis motion runs as Qt property animations, so nothing ticks while idle
+        self._pan_anim = self._create_animation(b"pan")
+        self._tilt_anim = self._create_animation(b"tilt")
         
         # Status
         self.status = "Ready"
         
+    def _get_pan(self) -> float:
+        return float(self._pos[PAN])
+    
+    def _set_pan(self, angle: float):
+        self._pos[PAN] = angle
+        self._emit_position()
+        
+    def _get_tilt(self) -> float:
+        return float(self._pos[TILT])
+    
+    def _set_tilt(self, angle: float):
+        self._pos[TILT] = angle
+        self._emit_position()
+        
+    # Animatable axis angles
+    pan = pyqtProperty(float, fget=_get_pan, fset=_set_pan)
+    tilt = pyqtProperty(float, fget=_get_tilt, fset=_set_tilt)
+        
+    @property
+    def target_pan(self) -> float:
+        """Pan angle being moved to"""
+        return float(self._target[PAN])
+    
+    @target_pan.setter
+    def target_pan(self, angle: float):
+        self._target[PAN] = angle
+        
+    @property
+    def target_tilt(self) -> float:
+        """Tilt angle being moved to"""
+        return float(self._target[TILT])
+    
+    @target_tilt.setter
+    def target_tilt(self, angle: float):
+        self._target[TILT] = angle
+        
     def get_position(self) -> Dict[str, float]:
         """Get current gimbal position"""
         return {
@@ -39,19 +101,82 @@ class GimbalController(QObject):
     
     def pan_to(self, angle: float, speed: int = 5):
         """Pan to specific angle"""
-        self.target_pan = max(-180, min(180, angle))
-        self.speed = max(1, min(10, speed))
-        self.is_moving = True
-        self.status_changed.emit("Moving")
-        self.logger.info(f"Pan to {angle}° at speed {speed}")
+        if not math.isfinite(angle):
+            # NaN would pass the clamp below; infinities have no meaningful target
+            self.logger.warning(f"Ignoring non-finite pan angle: {angle}")
+            return
+        self.target_pan = -180.0 if angle < -180.0 else (180.0 if angle > 180.0 else angle)
+        self.speed = 1 if speed < 1 else (10 if speed > 10 else speed)
+        self._start_moving()
+        self._animate(self._pan_anim, PAN)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Pan to {angle}° at speed {speed}")
         
     def tilt_to(self, angle: float, speed: int = 5):
         """Tilt to specific angle"""
-        self.target_tilt = max(-90, min(90, angle))
-        self.speed = max(1, min(10, speed))
-        self.is_moving = True
-        self.status_changed.emit("Moving")
-        self.logger.info(f"Tilt to {angle}° at speed {speed}")
+        if not math.isfinite(angle):
+            # NaN would pass the clamp below; infinities have no meaningful target
+            self.logger.warning(f"Ignoring non-finite tilt angle: {angle}")
+            return
+        self.target_tilt = -90.0 if angle < -90.0 else (90.0 if angle > 90.0 else angle)
+        self.speed = 1 if speed < 1 else (10 if speed > 10 else speed)
+        self._start_moving()
+        self._animate(self._tilt_anim, TILT)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Tilt to {angle}° at speed {speed}")
+        
+    def _create_animation(self, prop: bytes) -> QPropertyAnimation:
+        """Create the animation driving one axis property"""
+        animation = QPropertyAnimation(self, prop, self)
+        animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        animation.finished.connect(self._on_animation_finished)
+        return animation
+        
+    def _animate(self, animation: QPropertyAnimation, axis: int):
+        """(Re)start an axis animation from its current angle to the target"""
+        animation.stop()
+        start = float(self._pos[axis])
+        end = float(self._target[axis])
+        distance = abs(end - start)
+        if distance < SNAP_DISTANCE:
+            # Close enough, no animation needed. Check for arrival once
+            # control returns to the event loop, after the caller has set up
+            # every axis it moves
+            self._pos[axis] = end
+            QTimer.singleShot(0, self._on_animation_finished)
+            return
+            
+        animation.setStartValue(start)
+        animation.setEndValue(end)
+        animation.setDuration(max(1, int(1000 * distance / (self.speed * DEG_PER_SEC_PER_SPEED))))
+        animation.start()
+        
+    def _on_animation_finished(self):
+        """Leave the moving state once both axes have arrived"""
+        if not self.is_moving:
+            return
+        stopped = QAbstractAnimation.State.Stopped
+        if self._pan_anim.state() == stopped and self._tilt_anim.state() == stopped:
+            self.is_moving = False
+            self._emit_position(force=True)
+            self.status_changed.emit("Ready")
+            
+    def _emit_position(self, force: bool = False):
+        """Announce the current pose if it moved enough to matter"""
+        pos = self._pos
+        if force:
+            changed = (pos != self._emitted).any()
+        else:
+            changed = (np.abs(pos - self._emitted) > POSITION_EPSILON).any()
+        if changed:
+            self._emitted[:] = pos
+            self.position_changed.emit(float(pos[PAN]), float(pos[TILT]), self.speed)
+            
+    def _start_moving(self):
+        """Enter the moving state, announcing it only on the transition"""
+        if not self.is_moving:
+            self.is_moving = True
+            self.status_changed.emit("Moving")
         
     def move_to_home(self):
         """Move to home position"""
@@ -61,35 +186,13 @@ class GimbalController(QObject):
         
     def stop(self):
         """Stop movement"""
+        self._pan_anim.stop()
+        self._tilt_anim.stop()
         self.is_moving = False
-        self.target_pan = self.pan
-        self.target_tilt = self.tilt
+        self._target[:] = self._pos
         self.status_changed.emit("Ready")
         self.logger.info("Movement stopped")
         
-    def update(self):
-        """Update gimbal position (called by main loop)"""
-        if not self.is_moving:
-            return
-            
-        # Smooth movement towards target
-        pan_diff = self.target_pan - self.pan
-        tilt_diff = self.target_tilt - self.tilt
-        
-        if abs(pan_diff) < 0.1 and abs(tilt_diff) < 0.1:
-            # Close enough, stop movement
-            self.pan = self.target_pan
-            self.tilt = self.target_tilt
-            self.is_moving = False
-            self.status_changed.emit("Ready")
-        else:
-            # Move towards target
-            move_speed = self.speed / 100.0
-            self.pan += pan_diff * move_speed
-            self.tilt += tilt_diff * move_speed
-            
-        self.position_changed.emit(self.get_position())
-        
     def cleanup(self):
         """Cleanup resources"""
         self.stop()
\ No newline at end of file
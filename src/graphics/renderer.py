@@ -1,14 +1,18 @@
 """Simple 3D Renderer for Gimbal Visualization"""
 
 import logging
-import math
-from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import QTimer, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QBrush
+import time
+from collections import deque
+from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+from PyQt6.QtCore import QElapsedTimer, QLineF, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QBrush, QPixmap, QSurfaceFormat
 from PyQt6.QtCore import Qt
 
-class GimbalRenderer(QWidget):
-    """Simple 2D representation of gimbal for now"""
+# Combined pan + tilt change (degrees) below which a moving gimbal is not repainted
+REPAINT_THRESHOLD = 0.25
+
+class GimbalRenderer(QOpenGLWidget):
+    """Simple 2D representation of gimbal, rasterized on the GPU"""
     
     fps_updated = pyqtSignal(float)
     
@@ -17,23 +21,43 @@ class GimbalRenderer(QWidget):
         self.config = config
         self.logger = logging.getLogger(__name__)
         
+        # Multisampling for antialiased edges; vsync is set on the default
+        # format at startup, since the top-level window does the swapping
+        surface_format = QSurfaceFormat.defaultFormat()
+        surface_format.setSamples(4)
+        self.setFormat(surface_format)
+        
         # Gimbal state
         self.pan_angle = 0.0
         self.tilt_angle = 0.0
+        self._last_painted = (None, None)
+        self._last_seen = (None, None)
         
         # Rendering
         self.setMinimumSize(400, 300)
         self.setStyleSheet("background-color: #1a1a1a;")
         
-        # FPS tracking
-        self.frame_count = 0
-        self.fps_timer = QTimer()
-        self.fps_timer.timeout.connect(self.update_fps)
-        self.fps_timer.start(1000)
+        # Drawing resources, created once instead of on every frame
+        self._bg_color = QColor(26, 26, 26)
+        self._grid_pen = QPen(QColor(50, 50, 50), 1)
+        self._base_pen = QPen(QColor(100, 100, 100), 2)
+        self._base_brush = QBrush(QColor(50, 50, 50))
+        self._pan_pen = QPen(QColor(42, 130, 218), 3)
+        self._tilt_pen = QPen(QColor(255, 152, 0), 3)
+        self._cam_pen = QPen(QColor(76, 175, 80), 2)
+        self._cam_brush = QBrush(QColor(76, 175, 80, 100))
+        self._text_pen = QPen(QColor(255, 255, 255, 200))
+        self._status_font = QFont("Consolas", 12)
+        
+        # Paint timing, reported at debug level
+        self._paint_clock = QElapsedTimer()
+        
+        # Static layer (background, grid, base), rebuilt on resize
+        self._bg_pixmap = QPixmap()
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update)
+        # FPS tracking from recent frame timestamps
+        self._frame_times = deque(maxlen=120)
+        self._reported_fps = 0.0
         
         self.logger.info("Gimbal renderer initialized")
         
@@ -41,75 +65,127 @@ class GimbalRenderer(QWidget):
         """Initialize gimbal 3D model"""
         self.logger.info("Gimbal model initialized")
         
-    def start_rendering(self):
-        """Start the rendering loop"""
-        self.update_timer.start(16)  # ~60 FPS
-        
-    def update_gimbal_position(self, position):
-        """Update gimbal position"""
-        self.pan_angle = position['pan']
-        self.tilt_angle = position['tilt']
-        self.update()  # Trigger repaint
-        
-    def update_fps(self):
-        """Update FPS counter"""
-        self.fps_updated.emit(60.0)
-        self.frame_count = 0
-        
+    def request_repaint(self):
+        """Repaint if the gimbal moved visibly or came to rest off the last frame"""
+        position = (self.pan_angle, self.tilt_angle)
+        settled = position == self._last_seen
+        self._last_seen = position
+        if position == self._last_painted:
+            return
+            
+        last_pan, last_tilt = self._last_painted
+        if (last_pan is None or settled or
+                abs(position[0] - last_pan) + abs(position[1] - last_tilt) > REPAINT_THRESHOLD):
+            self.update()
+        
+    def update_gimbal_position(self, pan, tilt):
+        """Update gimbal position (repainted on the next frame tick)"""
+        self.pan_angle = pan
+        self.tilt_angle = tilt
+        
+    def current_fps(self) -> float:
+        """Frame rate over the recent frame timestamps"""
+        times = self._frame_times
+        if len(times) < 2 or times[-1] == times[0]:
+            return 0.0
+        return (len(times) - 1) * 1e9 / (times[-1] - times[0])
+        
+    def reset_fps(self):
+        """Start a fresh frame-rate window, reporting no rate until frames arrive"""
+        self._frame_times.clear()
+        if self._reported_fps:
+            self._reported_fps = 0.0
+            self.fps_updated.emit(0.0)
+            
     def cleanup(self):
         """Cleanup renderer"""
-        if self.update_timer:
-            self.update_timer.stop()
-        if self.fps_timer:
-            self.fps_timer.stop()
+        self._frame_times.clear()
             
-    def paintEvent(self, event):
-        """Paint the gimbal visualization"""
-        painter = QPainter(self)
+    def initializeGL(self):
+        """Initialize GL state"""
+        self.logger.info("OpenGL surface initialized")
+        
+    def resizeGL(self, width, height):
+        """Rebuild the static layer for the new widget size"""
+        self._bg_pixmap = self._render_static_layer(width, height)
+        
+    def _render_static_layer(self, width, height):
+        """Draw the parts of the scene that only change on resize"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.frame_count += 1
         
-        # Get dimensions
-        width = self.width()
-        height = self.height()
+        # Background
+        painter.fillRect(0, 0, width, height, self._bg_color)
+        
+        # Grid
+        painter.setPen(self._grid_pen)
+        painter.drawLines(
+            [QLineF(x, 0, x, height) for x in range(0, width, 50)] +
+            [QLineF(0, y, width, y) for y in range(0, height, 50)]
+        )
+        
+        # Gimbal base
         center_x = width // 2
         center_y = height // 2
+        painter.setPen(self._base_pen)
+        painter.setBrush(self._base_brush)
+        painter.drawEllipse(center_x - 80, center_y + 50, 160, 40)
         
-        # Clear background
-        painter.fillRect(self.rect(), QColor(26, 26, 26))
+        painter.end()
+        return pixmap
         
-        # Draw grid
-        painter.setPen(QPen(QColor(50, 50, 50), 1))
-        for x in range(0, width, 50):
-            painter.drawLine(x, 0, x, height)
-        for y in range(0, height, 50):
-            painter.drawLine(0, y, width, y)
+    def paintGL(self):
+        """Paint the gimbal visualization"""
+        timing = self.logger.isEnabledFor(logging.DEBUG)
+        if timing:
+            self._paint_clock.start()
             
-        # Draw gimbal base
-        painter.setPen(QPen(QColor(100, 100, 100), 2))
-        painter.setBrush(QBrush(QColor(50, 50, 50)))
-        painter.drawEllipse(center_x - 80, center_y + 50, 160, 40)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._frame_times.append(time.perf_counter_ns())
+        fps = self.current_fps()
+        if abs(fps - self._reported_fps) > 1.0:
+            self._reported_fps = fps
+            self.fps_updated.emit(fps)
+        self._last_painted = (self.pan_angle, self.tilt_angle)
+        
+        # Background, grid and gimbal base in one blit
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        
+        # Moving parts are positioned by the painter transform
+        painter.save()
+        painter.translate(self.width() // 2, self.height() // 2)
         
         # Draw pan line
-        painter.setPen(QPen(QColor(42, 130, 218), 3))
-        pan_rad = math.radians(self.pan_angle)
-        pan_end_x = center_x + 80 * math.cos(pan_rad)
-        pan_end_y = center_y + 80 * math.sin(pan_rad)
-        painter.drawLine(center_x, center_y, int(pan_end_x), int(pan_end_y))
+        painter.rotate(self.pan_angle)
+        painter.setPen(self._pan_pen)
+        painter.drawLine(0, 0, 80, 0)
+        
+        # Move to the arm end, back in screen orientation
+        painter.translate(80, 0)
+        painter.rotate(-self.pan_angle)
         
         # Draw tilt offset
-        painter.setPen(QPen(QColor(255, 152, 0), 3))
         tilt_offset = int(self.tilt_angle * 1.5)
-        camera_y = int(pan_end_y) - tilt_offset
-        painter.drawLine(int(pan_end_x), int(pan_end_y), int(pan_end_x), camera_y)
+        painter.setPen(self._tilt_pen)
+        painter.drawLine(0, 0, 0, -tilt_offset)
         
         # Draw camera
-        painter.setPen(QPen(QColor(76, 175, 80), 2))
-        painter.setBrush(QBrush(QColor(76, 175, 80, 100)))
-        painter.drawEllipse(int(pan_end_x) - 15, camera_y - 15, 30, 30)
+        painter.setPen(self._cam_pen)
+        painter.setBrush(self._cam_brush)
+        painter.drawEllipse(-15, -tilt_offset - 15, 30, 30)
+        painter.restore()
         
         # Draw status
-        painter.setPen(QPen(QColor(255, 255, 255, 200)))
-        painter.setFont(QFont("Consolas", 12))
+        painter.setPen(self._text_pen)
+        painter.setFont(self._status_font)
         painter.drawText(10, 25, f"Pan: {self.pan_angle:.1f}°")
-        painter.drawText(10, 45, f"Tilt: {self.tilt_angle:.1f}°")
\ No newline at end of file
+        painter.drawText(10, 45, f"Tilt: {self.tilt_angle:.1f}°")
+        
+        if timing:
+            painter.end()
+            self.logger.debug(f"Frame painted in {self._paint_clock.nsecsElapsed() / 1e6:.3f} ms")
\ No newline at end of file
@@ -20,6 +20,9 @@ class ControlPanel(QWidget):
         self.gimbal_controller = gimbal_controller
         self.logger = logging.getLogger(__name__)
         
+        # True while an LLM command is in flight
+        self._llm_busy = False
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -40,9 +43,9 @@ class ControlPanel(QWidget):
         llm_layout.addWidget(self.command_input)
         
         # Send button
-        send_button = QPushButton("Send Command")
-        send_button.clicked.connect(self.send_llm_command)
-        llm_layout.addWidget(send_button)
+        self.send_button = QPushButton("Send Command")
+        self.send_button.clicked.connect(self.send_llm_command)
+        llm_layout.addWidget(self.send_button)
         
         # Response area
         self.response_label = QLabel("Ready")
@@ -70,11 +73,11 @@ class ControlPanel(QWidget):
         pan_layout.addWidget(QLabel("Pan:"))
         
         pan_left_btn = QPushButton("← 45°")
-        pan_left_btn.clicked.connect(lambda: self.manual_command("pan", -45))
+        pan_left_btn.clicked.connect(self._on_pan_left)
         pan_layout.addWidget(pan_left_btn)
         
         pan_right_btn = QPushButton("45° →")
-        pan_right_btn.clicked.connect(lambda: self.manual_command("pan", 45))
+        pan_right_btn.clicked.connect(self._on_pan_right)
         pan_layout.addWidget(pan_right_btn)
         
         manual_layout.addLayout(pan_layout)
@@ -84,11 +87,11 @@ class ControlPanel(QWidget):
         tilt_layout.addWidget(QLabel("Tilt:"))
         
         tilt_up_btn = QPushButton("↑ 30°")
-        tilt_up_btn.clicked.connect(lambda: self.manual_command("tilt", 30))
+        tilt_up_btn.clicked.connect(self._on_tilt_up)
         tilt_layout.addWidget(tilt_up_btn)
         
         tilt_down_btn = QPushButton("↓ 30°")
-        tilt_down_btn.clicked.connect(lambda: self.manual_command("tilt", -30))
+        tilt_down_btn.clicked.connect(self._on_tilt_down)
         tilt_layout.addWidget(tilt_down_btn)
         
         manual_layout.addLayout(tilt_layout)
@@ -103,9 +106,7 @@ class ControlPanel(QWidget):
         speed_layout.addWidget(self.speed_slider)
         
         self.speed_label = QLabel("5")
-        self.speed_slider.valueChanged.connect(
-            lambda v: self.speed_label.setText(str(v))
-        )
+        self.speed_slider.valueChanged.connect(self.speed_label.setNum)
         speed_layout.addWidget(self.speed_label)
         
         manual_layout.addLayout(speed_layout)
@@ -119,12 +120,23 @@ class ControlPanel(QWidget):
         layout.addStretch()
         
     def send_llm_command(self):
-        """Send LLM command"""
+        """Send LLM command (ignored while a previous one is in flight)"""
+        if self._llm_busy:
+            return
+            
         command = self.command_input.toPlainText().strip()
         if command:
+            self._llm_busy = True
+            self.send_button.setEnabled(False)
             self.response_label.setText("Processing...")
             self.llm_command_requested.emit(command)
             
+    def finish_llm_command(self, message: str, success: bool = True):
+        """Show the LLM command result and accept new commands"""
+        self._llm_busy = False
+        self.send_button.setEnabled(True)
+        self.update_response(message, success)
+            
     def manual_command(self, action: str, value: float):
         """Send manual command"""
         command = {
@@ -134,6 +146,22 @@ class ControlPanel(QWidget):
         }
         self.manual_command_requested.emit(command)
         
+    def _on_pan_left(self):
+        """Pan left button handler"""
+        self.manual_command("pan", -45)
+        
+    def _on_pan_right(self):
+        """Pan right button handler"""
+        self.manual_command("pan", 45)
+        
+    def _on_tilt_up(self):
+        """Tilt up button handler"""
+        self.manual_command("tilt", 30)
+        
+    def _on_tilt_down(self):
+        """Tilt down button handler"""
+        self.manual_command("tilt", -30)
+        
     def update_response(self, message: str, success: bool = True):
         """Update command response display"""
         self.response_label.setText(message)
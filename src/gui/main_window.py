@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QSplitter, QLabel, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QElapsedTimer
 from PyQt6.QtGui import QFont
 
 class MainWindow(QMainWindow):
@@ -24,6 +24,10 @@ class MainWindow(QMainWindow):
         from gui.control_panel import ControlPanel
         from gui.status_panel import StatusPanel
         from graphics.renderer import GimbalRenderer
+        from core.command_history import CommandHistory
+        
+        # Processed LLM commands, for session statistics
+        self.command_history = CommandHistory()
         
         # UI components
         self.control_panel = ControlPanel(config, gimbal_controller)
@@ -37,12 +41,24 @@ class MainWindow(QMainWindow):
         
         # Initialize renderer
         self.renderer.initialize_gimbal()
-        self.renderer.start_rendering()
         
-        # Start update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(16)  # ~60 FPS
+        # Single frame tick for the whole window; runs only while the gimbal
+        # moves, so a stationary gimbal schedules no wakeups at all
+        fps_target = max(1, config.graphics_fps_target)
+        self.frame_timer = QTimer()
+        if config.graphics_vsync:
+            # The compositor paces presentation; a plain repeating tick is enough
+            self.frame_timer.setInterval(max(1, 1000 // fps_target))
+            self.frame_timer.timeout.connect(self.renderer.request_repaint)
+        else:
+            # Ticks follow absolute deadlines on a monotonic clock, so whole
+            # millisecond timer intervals never round the frame rate
+            self.frame_timer.setSingleShot(True)
+            self.frame_timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self.frame_timer.timeout.connect(self.frame_tick)
+        self.frame_clock = QElapsedTimer()
+        self.frame_interval_ns = 1_000_000_000 // fps_target
+        self.next_frame_ns = 0
         
         self.logger.info("Main window initialized")
     
@@ -92,6 +108,35 @@ class MainWindow(QMainWindow):
             QPushButton:pressed {
                 background-color: #2a82da;
             }
+            QLabel[role="status"] {
+                padding: 8px;
+                font-family: 'Consolas', 'Monaco', monospace;
+                font-size: 14px;
+                background-color: #2a2a2a;
+                border: 1px solid #404040;
+                border-radius: 4px;
+                margin: 2px;
+            }
+            QLabel[role="info"] {
+                padding: 6px;
+                font-size: 12px;
+                background-color: #2a2a2a;
+                border: 1px solid #404040;
+                border-radius: 4px;
+                margin: 1px;
+            }
+            QLabel[state="ready"], QLabel[state="connected"] {
+                border-color: #4caf50;
+                color: #4caf50;
+            }
+            QLabel[state="moving"] {
+                border-color: #ff9800;
+                color: #ff9800;
+            }
+            QLabel[state="error"] {
+                border-color: #f44336;
+                color: #f44336;
+            }
         """)
     
     def setup_ui(self):
@@ -164,26 +209,38 @@ class MainWindow(QMainWindow):
         self.control_panel.manual_command_requested.connect(self.process_manual_command)
         self.control_panel.gimbal_home_requested.connect(self.gimbal_home)
         
+        # LLM service connections
+        self.llm_service.command_processed.connect(self.on_command_processed)
+        
         # Gimbal controller connections
-        self.gimbal_controller.position_changed.connect(self.on_position_changed)
+        self.gimbal_controller.position_changed.connect(
+            self.on_position_changed, Qt.ConnectionType.QueuedConnection
+        )
         self.gimbal_controller.status_changed.connect(self.on_status_changed)
+        
+        # Renderer connections
+        self.renderer.fps_updated.connect(self.status_panel.update_fps)
     
     def process_llm_command(self, command: str):
         """Process LLM command"""
         try:
             self.logger.info(f"Processing: {command}")
             
-            # Process command
-            result = self.llm_service.process_command(command)
-            
-            # Update UI
-            self.control_panel.update_response(result.message, result.success)
-            
-            if result.success:
-                self.execute_gimbal_command(result)
+            # Result arrives through on_command_processed
+            self.llm_service.submit_command(command)
             
         except Exception as e:
-            self.control_panel.update_response(f"Error: {str(e)}", False)
+            self.control_panel.finish_llm_command(f"Error: {str(e)}", False)
+            
+    def on_command_processed(self, result):
+        """Handle a processed LLM command"""
+        self.command_history.append(result)
+        
+        # Update UI
+        self.control_panel.finish_llm_command(result.message, result.success)
+        
+        if result.success:
+            self.execute_gimbal_command(result)
     
     def process_manual_command(self, command_data):
         """Process manual command"""
@@ -219,23 +276,55 @@ class MainWindow(QMainWindow):
         self.gimbal_controller.move_to_home()
         self.control_panel.update_response("Moving to home", True)
     
-    def on_position_changed(self, position):
+    def on_position_changed(self, pan, tilt, speed):
         """Handle position change"""
-        self.status_panel.update_gimbal_position(position)
-        self.renderer.update_gimbal_position(position)
+        self.status_panel.update_gimbal_position(pan, tilt, speed)
+        self.renderer.update_gimbal_position(pan, tilt)
     
     def on_status_changed(self, status):
         """Handle status change"""
         self.status_panel.update_status(status)
+        
+        # Frames are only painted while moving, so each run measures FPS afresh
+        self.renderer.reset_fps()
+        if status == "Moving":
+            self.start_frames()
+        else:
+            # Stopped: paint the final pose once and go idle
+            self.frame_timer.stop()
+            self.renderer.update()
     
-    def update_display(self):
-        """Update display"""
-        self.gimbal_controller.update()
-    
+    def start_frames(self):
+        """Start the frame tick"""
+        if not self.frame_timer.isSingleShot():
+            self.frame_timer.start()
+            return
+            
+        self.frame_clock.start()
+        self.next_frame_ns = self.frame_interval_ns
+        self.frame_timer.start(self.frame_interval_ns // 1_000_000)
+        
+    def frame_tick(self):
+        """Deadline-paced frame tick (vsync off): repaint and schedule the next frame"""
+        self.renderer.request_repaint()
+        
+        self.next_frame_ns += self.frame_interval_ns
+        now_ns = self.frame_clock.nsecsElapsed()
+        if now_ns > self.next_frame_ns:
+            # Fell behind (e.g. a long paint); resync rather than burst
+            self.next_frame_ns = now_ns + self.frame_interval_ns
+        self.frame_timer.start((self.next_frame_ns - now_ns) // 1_000_000)
+        
     def closeEvent(self, event):
         """Handle window close"""
-        if hasattr(self, 'update_timer'):
-            self.update_timer.stop()
+        history = self.command_history
+        if len(history):
+            self.logger.info(
+                f"Session: {len(history)} LLM commands, {history.success_rate():.0%} understood, "
+                f"mean pan {history.mean_value('pan'):.1f}°, mean tilt {history.mean_value('tilt'):.1f}°"
+            )
+        self.frame_timer.stop()
         self.renderer.cleanup()
         self.gimbal_controller.cleanup()
+        self.llm_service.cleanup()
         event.accept()
\ No newline at end of file
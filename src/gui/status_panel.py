@@ -1,5 +1,7 @@
 """Status Panel GUI component"""
 
+import platform
+import sys
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGroupBox
 from PyQt6.QtCore import Qt
 
@@ -11,6 +13,11 @@ class StatusPanel(QWidget):
         self.config = config
         self.gimbal_controller = gimbal_controller
         
+        # Last values shown in the position labels
+        self._last_pan = None
+        self._last_tilt = None
+        self._last_speed = None
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -28,18 +35,9 @@ class StatusPanel(QWidget):
         self.speed_label = QLabel("Speed: 5")
         self.status_label = QLabel("Status: Ready")
         
+        # Styled by the main window stylesheet through the role property
         for label in [self.pan_label, self.tilt_label, self.speed_label, self.status_label]:
-            label.setStyleSheet("""
-                QLabel {
-                    padding: 8px;
-                    font-family: 'Consolas', 'Monaco', monospace;
-                    font-size: 14px;
-                    background-color: #2a2a2a;
-                    border: 1px solid #404040;
-                    border-radius: 4px;
-                    margin: 2px;
-                }
-            """)
+            label.setProperty("role", "status")
             status_layout.addWidget(label)
             
         layout.addWidget(status_group)
@@ -48,24 +46,13 @@ class StatusPanel(QWidget):
         info_group = QGroupBox("💻 System Info")
         info_layout = QVBoxLayout(info_group)
         
-        import platform
-        import sys
-        
         self.platform_label = QLabel(f"Platform: {platform.system()}")
         self.python_label = QLabel(f"Python: {sys.version.split()[0]}")
         self.llm_status_label = QLabel("LLM: Checking...")
+        self.fps_label = QLabel("FPS: --")
         
-        for label in [self.platform_label, self.python_label, self.llm_status_label]:
-            label.setStyleSheet("""
-                QLabel {
-                    padding: 6px;
-                    font-size: 12px;
-                    background-color: #2a2a2a;
-                    border: 1px solid #404040;
-                    border-radius: 4px;
-                    margin: 1px;
-                }
-            """)
+        for label in [self.platform_label, self.python_label, self.llm_status_label, self.fps_label]:
+            label.setProperty("role", "info")
             info_layout.addWidget(label)
             
         layout.addWidget(info_group)
@@ -73,11 +60,22 @@ class StatusPanel(QWidget):
         # Add stretch to push content to top
         layout.addStretch()
         
-    def update_gimbal_position(self, position):
+    def update_gimbal_position(self, pan, tilt, speed):
         """Update gimbal position display"""
-        self.pan_label.setText(f"Pan: {position['pan']:.1f}°")
-        self.tilt_label.setText(f"Tilt: {position['tilt']:.1f}°")
-        self.speed_label.setText(f"Speed: {position['speed']}")
+        # Only touch labels whose displayed (0.1°) value changed
+        pan = round(pan, 1)
+        if pan != self._last_pan:
+            self._last_pan = pan
+            self.pan_label.setText(f"Pan: {pan:.1f}°")
+            
+        tilt = round(tilt, 1)
+        if tilt != self._last_tilt:
+            self._last_tilt = tilt
+            self.tilt_label.setText(f"Tilt: {tilt:.1f}°")
+            
+        if speed != self._last_speed:
+            self._last_speed = speed
+            self.speed_label.setText(f"Speed: {speed}")
         
     def update_status(self, status):
         """Update gimbal status"""
@@ -85,38 +83,27 @@ class StatusPanel(QWidget):
         
         # Color coding
         if status == "Ready":
-            color = "#4caf50"
+            state = "ready"
         elif status == "Moving":
-            color = "#ff9800"
+            state = "moving"
         else:
-            color = "#f44336"
-            
-        self.status_label.setStyleSheet(f"""
-            QLabel {{
-                padding: 8px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 14px;
-                background-color: #2a2a2a;
-                border: 1px solid {color};
-                border-radius: 4px;
-                margin: 2px;
-                color: {color};
-            }}
-        """)
+            state = "error"
+        self._set_state(self.status_label, state)
         
     def update_llm_status(self, status):
         """Update LLM connection status"""
         self.llm_status_label.setText(f"LLM: {status}")
-        
-        color = "#4caf50" if "Connected" in status else "#f44336"
-        self.llm_status_label.setStyleSheet(f"""
-            QLabel {{
-                padding: 6px;
-                font-size: 12px;
-                background-color: #2a2a2a;
-                border: 1px solid {color};
-                border-radius: 4px;
-                margin: 1px;
-                color: {color};
-            }}
-        """)
\ No newline at end of file
+        self._set_state(self.llm_status_label, "connected" if "Connected" in status else "error")
+        
+    def update_fps(self, fps):
+        """Update rendering frame rate"""
+        self.fps_label.setText(f"FPS: {fps:.0f}" if fps else "FPS: --")
+        
+    def _set_state(self, label, state):
+        """Switch a label's state property and re-polish it (no stylesheet re-parse)"""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
\ No newline at end of file
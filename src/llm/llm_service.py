@@ -3,12 +3,14 @@
 import logging
 import json
 import re
-from dataclasses import dataclass
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+import httpx
 from PyQt6.QtCore import QObject, pyqtSignal
+from llm.request_batcher import RequestBatcher
 
-@dataclass
-class GimbalCommand:
+class GimbalCommand(NamedTuple):
     """Structured gimbal command"""
     action: str  # pan, tilt, home, stop
     value: float = 0.0  # degrees
@@ -16,26 +18,196 @@ class GimbalCommand:
     message: str = ""
     success: bool = True
     error: Optional[str] = None
+    confidence: float = 1.0  # 0-1, how unambiguous the parse was
+
+# Fallback parser keywords, one flag bit each
+_KW_HOME, _KW_CENTER, _KW_STOP, _KW_HALT, _KW_PAN = 1, 2, 4, 8, 16
+_KW_LEFT, _KW_RIGHT, _KW_TILT, _KW_UP, _KW_DOWN = 32, 64, 128, 256, 512
+_KEYWORDS = {
+    'home': _KW_HOME, 'center': _KW_CENTER, 'stop': _KW_STOP, 'halt': _KW_HALT,
+    'pan': _KW_PAN, 'left': _KW_LEFT, 'right': _KW_RIGHT,
+    'tilt': _KW_TILT, 'up': _KW_UP, 'down': _KW_DOWN,
+}
+_HOME_WORDS = _KW_HOME | _KW_CENTER
+_STOP_WORDS = _KW_STOP | _KW_HALT
+_PAN_WORDS = _KW_PAN | _KW_LEFT | _KW_RIGHT
+_TILT_WORDS = _KW_TILT | _KW_UP | _KW_DOWN
+
+# Keyword-parsed commands at or above this confidence skip the LLM
+FAST_PATH_CONFIDENCE = 1.0
+FAST_PATH_ACTIONS = frozenset({'pan', 'tilt', 'home', 'stop'})
+
+# One pass finds every keyword at the start of a word, so inflected forms
+# ("tilting", "upward") count; the first number is the angle. Literal
+# alternations and a digit run cannot backtrack, and ASCII-only classes
+# keep the per-character checks cheap.
+_KEYWORD_RE = re.compile(r'\b(' + '|'.join(_KEYWORDS) + r')\w*', re.ASCII)
+_NUMBER_RE = re.compile(r'\d+', re.ASCII)
+
+# Signs, fractions and speed wording the keyword parser can't represent
+_INEXACT_RE = re.compile(r'[-.]|slow|fast|speed', re.ASCII)
+
+def _keyword_builder(found: int):
+    """Command builder for one combination of keyword flags
+    
+    The builder takes the first number in the command (a digit string, or
+    None) and whether that number is the command's only, plain angle, and
+    returns the command. Home, stop and unrecognized commands don't depend
+    on either and always return the same instance. The result is fully
+    confident only when exactly one action is named and, for pan/tilt,
+    exactly one direction word and an exact angle were found.
+    """
+    # Home position
+    if found & _HOME_WORDS:
+        command = GimbalCommand(
+            action="home",
+            message="Moving to home position",
+            confidence=0.5 if found & (_STOP_WORDS | _PAN_WORDS | _TILT_WORDS) else 1.0
+        )
+        return lambda number, exact: command
+        
+    # Stop
+    if found & _STOP_WORDS:
+        command = GimbalCommand(
+            action="stop",
+            message="Stopping movement",
+            confidence=0.5 if found & (_PAN_WORDS | _TILT_WORDS) else 1.0
+        )
+        return lambda number, exact: command
+        
+    # Pan commands
+    if found & _PAN_WORDS:
+        direction = -1 if found & _KW_LEFT else 1
+        word = 'left' if direction < 0 else 'right'
+        directions = found & (_KW_LEFT | _KW_RIGHT)
+        certain = not found & _TILT_WORDS and directions in (_KW_LEFT, _KW_RIGHT)
+        
+        def build_pan(number, exact):
+            degrees = int(number) if number else 30
+            return GimbalCommand(
+                action="pan",
+                value=direction * degrees,
+                message=f"Panning {word} {degrees}°",
+                confidence=1.0 if certain and exact else 0.5
+            )
+        return build_pan
+        
+    # Tilt commands
+    if found & _TILT_WORDS:
+        direction = 1 if found & _KW_UP else -1
+        word = 'up' if direction > 0 else 'down'
+        certain = found & (_KW_UP | _KW_DOWN) in (_KW_UP, _KW_DOWN)
+        
+        def build_tilt(number, exact):
+            degrees = int(number) if number else 30
+            return GimbalCommand(
+                action="tilt",
+                value=direction * degrees,
+                message=f"Tilting {word} {degrees}°",
+                confidence=1.0 if certain and exact else 0.5
+            )
+        return build_tilt
+        
+    command = GimbalCommand(
+        action="error",
+        message="Command not understood",
+        success=False,
+        confidence=0.0
+    )
+    return lambda number, exact: command
+
+# Command builders for every keyword combination, indexed by flag bits
+_DISPATCH = tuple(_keyword_builder(found) for found in range(1 << len(_KEYWORDS)))
+
+def _parse_keywords(command: str) -> GimbalCommand:
+    """Classify a command from the keywords it contains
+    
+    Matched keywords are collected as flag bits in a single regex scan and
+    the command is built by the precomputed builder for that combination.
+    """
+    lowered = command.lower()
+    found = 0
+    for match in _KEYWORD_RE.finditer(lowered):
+        found |= _KEYWORDS[match.group(1)]
+    numbers = _NUMBER_RE.findall(command)
+    exact = len(numbers) == 1 and _INEXACT_RE.search(lowered) is None
+    return _DISPATCH[found](numbers[0] if numbers else None, exact)
+
+def _clamp_speed(speed) -> int:
+    """Speed as an integer within 1-10"""
+    speed = int(speed)
+    return 1 if speed < 1 else (10 if speed > 10 else speed)
+
+def _command_from_reply(response: str) -> GimbalCommand:
+    """Build a command from a JSON-mode LLM reply, raising if it is malformed"""
+    data = json.loads(response)
+    return GimbalCommand(
+        action=data.get('action', 'error'),
+        value=float(data.get('value', 0)),
+        speed=_clamp_speed(data.get('speed', 5)),
+        message=data.get('message', f"Executing {data.get('action')} command"),
+        success=True
+    )
 
 class LLMService(QObject):
     """LLM service with Ollama integration"""
     
     command_processed = pyqtSignal(object)  # GimbalCommand
     
+    # Identical on every request, so the server can reuse the evaluated prompt
+    _SYSTEM_MSG = {
+        'role': 'system',
+        'content': """You are a gimbal controller. Parse commands and return ONLY JSON:
+{"action": "pan"|"tilt"|"home"|"stop", "value": degrees, "speed": 1-10, "message": "confirmation"}
+
+Examples:
+"pan left 45" → {"action":"pan","value":-45,"speed":5,"message":"Panning left 45 degrees"}
+"tilt up 30" → {"action":"tilt","value":30,"speed":5,"message":"Tilting up 30 degrees"}
+"go home" → {"action":"home","value":0,"speed":5,"message":"Moving to home position"}"""
+    }
+    
+    # Greedy decoding, capped to the length of a short JSON reply (under 60 tokens)
+    _CHAT_OPTIONS = {'temperature': 0, 'top_k': 1, 'num_predict': 64}
+    
+    # Keep the model loaded between commands
+    _KEEP_ALIVE = '30m'
+    
     def __init__(self, config):
         super().__init__()
         self.config = config
         self.logger = logging.getLogger(__name__)
         
+        # Parsed commands by normalized text: (expiry time, command), LRU order
+        self._cache = OrderedDict()
+        
         # Test Ollama connection
         self.ollama_available = self._test_ollama_connection()
         
+        # Every LLM request, blocking or not, runs on the batcher's background
+        # loop and shares its inference limit
+        self._batcher = None
+        if self.ollama_available:
+            try:
+                self._batcher = RequestBatcher(
+                    config.ollama_url,
+                    batch_interval=config.ollama_batch_interval,
+                    max_concurrency=config.ollama_max_concurrency,
+                    max_pending=config.ollama_max_pending
+                )
+            except Exception as e:
+                self.logger.warning(f"Ollama not available: {e}")
+                self.ollama_available = False
+                
+        if self._batcher is not None:
+            self._batcher.reply_ready.connect(self._on_reply_ready)
+            self._batcher.request_failed.connect(self._on_request_failed)
+            self._batcher.request_dropped.connect(self._on_request_dropped)
+        
     def _test_ollama_connection(self) -> bool:
         """Test if Ollama is available"""
         try:
-            import ollama
-            client = ollama.Client(host=self.config.ollama_url)
-            models = client.list()
+            # Version endpoint: a tiny reply, unlike listing every installed model
+            httpx.get(f"{self.config.ollama_url}/api/version", timeout=0.5).raise_for_status()
             self.logger.info("Ollama connected successfully")
             return True
         except Exception as e:
@@ -43,44 +215,120 @@ class LLMService(QObject):
             return False
     
     def process_command(self, command: str) -> GimbalCommand:
-        """Process natural language command"""
+        """Process natural language command, blocking on the LLM if needed"""
         try:
-            if self.ollama_available:
-                return self._process_with_ollama(command)
-            else:
-                return self._fallback_parsing(command)
+            result = self._process_locally(command)
+            if result is None:
+                result = self._process_with_ollama(command)
+            return result
         except Exception as e:
             self.logger.error(f"Command processing failed: {e}")
-            return GimbalCommand(
-                action="error",
-                message=f"Error: {str(e)}",
-                success=False,
-                error=str(e)
-            )
+            return self._error_command(e)
+            
+    def submit_command(self, command: str):
+        """Process natural language command without blocking
+        
+        The result is delivered through command_processed: immediately when it
+        can be resolved locally, otherwise once the LLM replies.
+        """
+        try:
+            result = self._process_locally(command)
+        except Exception as e:
+            self.logger.error(f"Command processing failed: {e}")
+            result = self._error_command(e)
+            
+        if result is None:
+            self._batcher.submit(command, self._chat_payload(command))
+        else:
+            self.command_processed.emit(result)
+            
+    def cleanup(self):
+        """Stop background request processing"""
+        if self._batcher is not None:
+            self._batcher.close()
+            
+    def _process_locally(self, command: str) -> Optional[GimbalCommand]:
+        """Resolve a command from the cache or keyword parser, None if it needs the LLM"""
+        cached = self._cache_lookup(command.lower().strip())
+        if cached is not None:
+            return cached
+            
+        if self.ollama_available:
+            # Plain commands don't need an LLM round-trip
+            result = _parse_keywords(command)
+            if result.action not in FAST_PATH_ACTIONS or result.confidence < FAST_PATH_CONFIDENCE:
+                return None
+            self._remember(command, result)
+            return result
+            
+        return self._fallback_parsing(command)
+        
+    def _on_reply_ready(self, command: str, response_text: str):
+        """Finish a batched command from the LLM reply"""
+        self.command_processed.emit(self._parse_llm_response(response_text.strip(), command))
+        
+    def _on_request_failed(self, command: str, error: str):
+        """Finish a batched command with keyword parsing after an LLM failure"""
+        self.logger.warning(f"Ollama processing failed: {error}")
+        self.command_processed.emit(self._fallback_parsing(command))
+        
+    def _on_request_dropped(self, command: str):
+        """Report a batched command dropped because the request queue was full"""
+        self.command_processed.emit(GimbalCommand(
+            action="error",
+            message="LLM busy, command dropped",
+            success=False,
+            error="busy"
+        ))
+        
+    def _error_command(self, error: Exception) -> GimbalCommand:
+        """Command reporting a processing failure"""
+        return GimbalCommand(
+            action="error",
+            message=f"Error: {str(error)}",
+            success=False,
+            error=str(error)
+        )
+        
+    def _remember(self, command: str, result: GimbalCommand):
+        """Cache a successfully parsed command (LLM replies and fast-path parses only)"""
+        if result.success:
+            self._cache_store(command.lower().strip(), result)
+        
+    def _cache_lookup(self, key: str) -> Optional[GimbalCommand]:
+        """Return the cached, unexpired command for the key"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, command = entry
+        if expires < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return command
+        
+    def _cache_store(self, key: str, command: GimbalCommand):
+        """Cache a command, evicting the least recently used beyond the size cap"""
+        self._cache[key] = (time.monotonic() + self.config.llm_cache_ttl, command)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.config.llm_cache_size:
+            self._cache.popitem(last=False)
+    
+    def _chat_payload(self, command: str) -> dict:
+        """Chat request for a command, shared by the blocking and batched paths"""
+        return {
+            'model': self.config.ollama_model,
+            'messages': [self._SYSTEM_MSG, {'role': 'user', 'content': command}],
+            'stream': False,
+            'format': 'json',
+            'options': self._CHAT_OPTIONS,
+            'keep_alive': self._KEEP_ALIVE
+        }
     
     def _process_with_ollama(self, command: str) -> GimbalCommand:
         """Process command using Ollama"""
-        import ollama
-        
-        system_prompt = """You are a gimbal controller. Parse commands and return ONLY JSON:
-{"action": "pan"|"tilt"|"home"|"stop", "value": degrees, "speed": 1-10, "message": "confirmation"}
-
-Examples:
-"pan left 45" → {"action":"pan","value":-45,"speed":5,"message":"Panning left 45 degrees"}
-"tilt up 30" → {"action":"tilt","value":30,"speed":5,"message":"Tilting up 30 degrees"}
-"go home" → {"action":"home","value":0,"speed":5,"message":"Moving to home position"}"""
-        
         try:
-            client = ollama.Client(host=self.config.ollama_url)
-            response = client.chat(
-                model=self.config.ollama_model,
-                messages=[
-                    {'role': 'system', 'content': system_prompt},
-                    {'role': 'user', 'content': command}
-                ]
-            )
-            
-            response_text = response['message']['content'].strip()
+            response_text = self._batcher.request(self._chat_payload(command)).strip()
             return self._parse_llm_response(response_text, command)
             
         except Exception as e:
@@ -88,68 +336,14 @@ Examples:
             return self._fallback_parsing(command)
     
     def _parse_llm_response(self, response: str, original_command: str) -> GimbalCommand:
-        """Parse LLM JSON response"""
+        """Parse LLM JSON response, caching it; unparseable replies fall back uncached"""
         try:
-            # Extract JSON from response
-            json_match = re.search(r'\{[^}]+\}', response)
-            if not json_match:
-                raise ValueError("No JSON found")
-            
-            data = json.loads(json_match.group())
-            
-            return GimbalCommand(
-                action=data.get('action', 'error'),
-                value=float(data.get('value', 0)),
-                speed=max(1, min(10, int(data.get('speed', 5)))),
-                message=data.get('message', f"Executing {data.get('action')} command"),
-                success=True
-            )
-            
+            result = _command_from_reply(response)
         except Exception as e:
             return self._fallback_parsing(original_command)
+        self._remember(original_command, result)
+        return result
     
     def _fallback_parsing(self, command: str) -> GimbalCommand:
-        """Fallback regex parsing"""
-        cmd = command.lower().strip()
-        
-        # Home position
-        if any(word in cmd for word in ['home', 'center']):
-            return GimbalCommand(
-                action="home",
-                message="Moving to home position"
-            )
-        
-        # Stop
-        if any(word in cmd for word in ['stop', 'halt']):
-            return GimbalCommand(
-                action="stop", 
-                message="Stopping movement"
-            )
-        
-        # Extract number
-        numbers = re.findall(r'\d+', cmd)
-        degrees = int(numbers[0]) if numbers else 30
-        
-        # Pan commands
-        if any(word in cmd for word in ['pan', 'left', 'right']):
-            direction = -1 if 'left' in cmd else 1
-            return GimbalCommand(
-                action="pan",
-                value=direction * degrees,
-                message=f"Panning {'left' if direction < 0 else 'right'} {degrees}°"
-            )
-        
-        # Tilt commands  
-        if any(word in cmd for word in ['tilt', 'up', 'down']):
-            direction = 1 if 'up' in cmd else -1
-            return GimbalCommand(
-                action="tilt",
-                value=direction * degrees,
-                message=f"Tilting {'up' if direction > 0 else 'down'} {degrees}°"
-            )
-        
-        return GimbalCommand(
-            action="error",
-            message="Command not understood",
-            success=False
-        )
\ No newline at end of file
+        """Fallback keyword parsing"""
+        return _parse_keywords(command)
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""Background request batching for Ollama chat calls"""
+
+import asyncio
+import logging
+import threading
+import httpx
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class RequestBatcher(QObject):
+    """Runs Ollama chat requests on a background asyncio loop
+    
+    Requests arriving within batch_interval of each other are collected into
+    one batch. Identical commands in a batch share a single HTTP request.
+    At most max_concurrency requests run at once, blocking requests made
+    through request() included, and up to max_pending queued requests wait
+    for a free slot; beyond that the oldest waiting request is dropped.
+    Queued results are delivered through Qt signals, so slots run on the
+    receiver's thread.
+    """
+    
+    reply_ready = pyqtSignal(str, str)  # command, reply text
+    request_failed = pyqtSignal(str, str)  # command, error
+    request_dropped = pyqtSignal(str)  # command
+    
+    def __init__(self, base_url: str, batch_interval: float = 0.02,
+                 max_batch: int = 8, max_concurrency: int = 1, max_pending: int = 4):
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.base_url = base_url
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        
+        # Created on the worker thread, inside its loop
+        self._queue = None
+        self._pending = None
+        self._slots = None
+        self._client = None
+        
+        self._closing = False
+        self._running = False
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ollama-batcher", daemon=True)
+        self._thread.start()
+        if not self._started.wait(timeout=5.0) or not self._running:
+            self._closing = True
+            raise RuntimeError("Request batcher failed to start")
+        
+    def submit(self, command: str, payload: dict):
+        """Queue a chat request (safe to call from any thread)"""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (command, payload))
+        
+    def request(self, payload: dict) -> str:
+        """Run a chat request and return the reply text, blocking the calling thread
+        
+        Takes an inference slot like queued requests do, so both share the
+        concurrency limit. Must not be called from the batcher's own thread.
+        """
+        if self._closing:
+            raise RuntimeError("Request batcher is closed")
+        future = asyncio.run_coroutine_threadsafe(self._chat(payload), self._loop)
+        return future.result()
+        
+    def close(self):
+        """Stop the worker, abandoning requests still in flight"""
+        self._closing = True
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+            self._thread.join(timeout=2.0)
+            
+    def _run(self):
+        """Worker thread entry point"""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._serve())
+        except Exception as e:
+            self.logger.error(f"Request batcher stopped: {e}")
+        finally:
+            # Never leave the constructor waiting if startup failed
+            self._started.set()
+            self._loop.close()
+            
+    async def _serve(self):
+        """Collect queued requests into batches and hand them to the workers"""
+        self._queue = asyncio.Queue()
+        self._pending = asyncio.Queue(maxsize=self.max_pending)
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        
+        # One pooled client keeps connections to Ollama alive between commands
+        limits = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300)
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=30.0, limits=limits) as client:
+            self._client = client
+            workers = [self._loop.create_task(self._work())
+                       for _ in range(self.max_concurrency)]
+            self._running = True
+            self._started.set()
+            running = True
+            while running:
+                item = await self._queue.get()
+                if item is None:
+                    break
+                    
+                batch = [item]
+                deadline = self._loop.time() + self.batch_interval
+                while len(batch) < self.max_batch:
+                    remaining = deadline - self._loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is None:
+                        running = False
+                        break
+                    batch.append(item)
+                    
+                await self._dispatch(batch)
+                
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            
+    async def _dispatch(self, batch: list):
+        """Queue one request per distinct command, dropping the oldest on overflow"""
+        groups = {}
+        for command, payload in batch:
+            if command in groups:
+                groups[command][1] += 1
+            else:
+                groups[command] = [payload, 1]
+                
+        if len(batch) > 1:
+            self.logger.debug(f"Dispatching {len(batch)} commands as {len(groups)} requests")
+            
+        for command, (payload, count) in groups.items():
+            if self._pending.full():
+                dropped, _, dropped_count = self._pending.get_nowait()
+                self.logger.warning(f"Request queue full, dropping: {dropped}")
+                for _ in range(dropped_count):
+                    self.request_dropped.emit(dropped)
+            self._pending.put_nowait((command, payload, count))
+            
+            # Let an idle worker take the request before the next overflow check
+            await asyncio.sleep(0)
+            
+    async def _work(self):
+        """Send queued requests one at a time"""
+        while True:
+            command, payload, count = await self._pending.get()
+            await self._send(command, payload, count)
+            
+    async def _chat(self, payload: dict) -> str:
+        """Run one chat request in an inference slot and return the reply text"""
+        async with self._slots:
+            response = await self._client.post('/api/chat', json=payload)
+            response.raise_for_status()
+            return response.json()['message']['content']
+            
+    async def _send(self, command: str, payload: dict, count: int):
+        """Run one queued chat request and report it to every submitter of the command"""
+        try:
+            content = await self._chat(payload)
+        except Exception as e:
+            for _ in range(count):
+                self.request_failed.emit(command, str(e))
+            return
+            
+        for _ in range(count):
+            self.reply_ready.emit(command, content)
@@ -7,6 +7,8 @@ Cross-platform gimbal control with LLM integration built in Python
 import sys
 import os
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add src directory to Python path
@@ -14,53 +16,77 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # PyQt6 imports
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QSurfaceFormat
 
-# Application imports
+# Application imports (heavier modules are imported where they are first used)
 from core.config import Config
-from core.gimbal_controller import GimbalController
-from llm.llm_service import LLMService
-from gui.main_window import MainWindow
 
-def setup_logging():
-    """Setup application logging"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('gimbal_app.log')
-        ]
-    )
+def setup_logging() -> QueueListener:
+    """Setup application logging
+    
+    Records are queued by the calling thread and written out by a background
+    listener, which the caller stops on shutdown.
+    """
+    handlers = [logging.FileHandler('gimbal_app.log', delay=True, encoding='utf-8')]
+    if sys.stderr is not None and sys.stderr.isatty():
+        handlers.append(logging.StreamHandler())
+        
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        
+    # The queued record carries only the merged message; the layout is applied by the listener
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+def setup_surface_format(config: Config):
+    """Set the default GL surface format; must run before QApplication is created
+    
+    The renderer draws into an offscreen buffer that the top-level window
+    composites, and that window's surface takes its swap interval from the
+    default format, so this is where vsync is switched on or off.
+    """
+    surface_format = QSurfaceFormat.defaultFormat()
+    surface_format.setSwapInterval(1 if config.graphics_vsync else 0)
+    QSurfaceFormat.setDefaultFormat(surface_format)
 
 class GimbalApplication(QApplication):
     """Main application class"""
     
-    def __init__(self, argv):
+    def __init__(self, argv, config: Config):
         super().__init__(argv)
         
         # Set application properties
         self.setApplicationName("Gimbal LLM Control")
         self.setApplicationVersion("1.0.0")
         
-        # Setup logging
-        setup_logging()
+        # Setup logging; main() stops the listener, flushing queued records, on every exit path
+        self.log_listener = setup_logging()
         self.logger = logging.getLogger(__name__)
         
         # Initialize components
-        self.config = None
+        self.config = config
         self.gimbal_controller = None
         self.llm_service = None
         self.main_window = None
         
+        # Error dialog, created on first use and reused afterwards
+        self._msgbox = None
+        
     def initialize_components(self):
         """Initialize application components"""
         
         try:
-            # Load configuration
-            self.config = Config()
-            self.logger.info("Configuration loaded")
+            from core.gimbal_controller import GimbalController
+            from llm.llm_service import LLMService
+            
+            self.logger.info(f"Configuration loaded (vsync {'on' if self.config.graphics_vsync else 'off'})")
             
             # Initialize gimbal controller
             self.gimbal_controller = GimbalController(self.config)
@@ -81,6 +107,8 @@ class GimbalApplication(QApplication):
         """Create and show the main window"""
         
         try:
+            from gui.main_window import MainWindow
+            
             self.main_window = MainWindow(
                 self.config,
                 self.llm_service,
@@ -98,11 +126,12 @@ class GimbalApplication(QApplication):
     
     def show_error(self, title: str, message: str):
         """Show error message box"""
-        msg = QMessageBox()
-        msg.setIcon(QMessageBox.Icon.Critical)
-        msg.setWindowTitle(title)
-        msg.setText(message)
-        msg.exec()
+        if self._msgbox is None:
+            self._msgbox = QMessageBox()
+            self._msgbox.setIcon(QMessageBox.Icon.Critical)
+        self._msgbox.setWindowTitle(title)
+        self._msgbox.setText(message)
+        self._msgbox.exec()
     
     def run(self):
         """Run the application"""
@@ -123,15 +152,24 @@ class GimbalApplication(QApplication):
 def main():
     """Main entry point"""
     
+    # Load configuration; GL surface defaults must be set before the application exists
+    config = Config()
+    setup_surface_format(config)
+    
     # Create application
-    app = GimbalApplication(sys.argv)
+    app = GimbalApplication(sys.argv, config)
     
     # Run application
-    if app.run():
-        # Start event loop
-        sys.exit(app.exec())
-    else:
-        sys.exit(1)
+    try:
+        if app.run():
+            # Start event loop
+            exit_code = app.exec()
+        else:
+            exit_code = 1
+    finally:
+        app.log_listener.stop()
+        
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file